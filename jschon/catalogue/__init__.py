@@ -51,6 +51,9 @@ class Catalogue:
         self._vocabularies: Dict[URI, Vocabulary] = {}
         self._format_validators: Dict[str, FormatValidator] = {}
         self._schema_cache: Dict[Hashable, Dict[URI, JSONSchema]] = {}
+        # incremented whenever the schema cache changes, so that
+        # lookups memoized against the cache can detect staleness
+        self._schema_cache_version: int = 0
         try:
             initializers = [self._version_initializers[version] for version in versions]
         except KeyError as e:
@@ -62,6 +65,13 @@ class Catalogue:
         if default:
             Catalogue._default_catalogue = self
 
+    @property
+    def schema_cache_version(self) -> int:
+        """A counter that changes whenever a schema is added to or removed
+        from the catalogue, or a session ends; lookups memoized against the
+        schema cache are stale once this value has changed."""
+        return self._schema_cache_version
+
     def add_directory(self, base_uri: URI, base_dir: PathLike) -> None:
         """Register a base URI-to-directory mapping.
         
@@ -215,8 +225,12 @@ class Catalogue:
         :param schema: the :class:`~jschon.jsonschema.JSONSchema` instance to cache
         :param session: a session identifier
         """
-        self._schema_cache.setdefault(session, {})
-        self._schema_cache[session][uri] = schema
+        session_cache = self._schema_cache.setdefault(session, {})
+        if session_cache.get(uri) is schema:
+            return
+
+        session_cache[uri] = schema
+        self._schema_cache_version += 1
 
     def del_schema(
             self,
@@ -231,6 +245,7 @@ class Catalogue:
         """
         if session in self._schema_cache:
             self._schema_cache[session].pop(uri, None)
+            self._schema_cache_version += 1
 
     def get_schema(
             self,
@@ -304,3 +319,4 @@ class Catalogue:
             yield session
         finally:
             self._schema_cache.pop(session, None)
+            self._schema_cache_version += 1
@@ -1,5 +1,4 @@
 import json
-from collections import deque
 from decimal import Decimal
 from os import PathLike
 from typing import Sequence, Mapping, TypeVar, Type, Optional, Iterator, Union, Any
@@ -132,11 +131,12 @@ class JSON(Sequence['JSON'], Mapping[str, 'JSON']):
     def path(self) -> JSONPointer:
         """A :class:`~jschon.jsonpointer.JSONPointer` representing
         the path to the instance from the document root."""
-        keys = deque()
+        keys = []
         node = self
         while node.parent is not None:
-            keys.appendleft(node.key)
+            keys += [node.key]
             node = node.parent
+        keys.reverse()
         return JSONPointer(keys)
 
     def __repr__(self) -> str:
@@ -1,7 +1,6 @@
-import collections
 import re
 import urllib.parse
-from typing import Sequence, Union, Iterable, overload, Any, Mapping
+from typing import Sequence, Union, Iterable, overload, Any, Mapping, List
 
 from jschon.exceptions import JSONPointerError
 
@@ -50,7 +49,7 @@ class JSONPointer(Sequence[str]):
        and referred to as *keys* in the JSONPointer class.
     """
 
-    _json_pointer_re = re.compile(r'^(/([^~/]|(~[01]))*)*$')
+    _invalid_escape_re = re.compile(r'~(?![01])')
     _array_index_re = re.compile(r'^0|([1-9][0-9]*)$')
 
     def __new__(cls, *values: Union[str, Iterable[str]]) -> 'JSONPointer':
@@ -62,24 +61,47 @@ class JSONPointer(Sequence[str]):
         :raise JSONPointerError: if a string argument does not conform to the RFC
             6901 syntax
         """
-        self = object.__new__(cls)
-        self._keys = []
+        if len(values) == 1 and isinstance(values[0], JSONPointer):
+            # keys are never modified in place, so they can be shared
+            return cls._from_keys(values[0]._keys)
 
+        keys = []
         for value in values:
             if isinstance(value, str):
-                if not self._json_pointer_re.fullmatch(value):
+                # a valid pointer is empty or starts with '/', and every '~'
+                # in it begins an escape sequence, either '~0' or '~1'
+                if value and value[0] != '/' or \
+                        '~' in value and cls._invalid_escape_re.search(value):
                     raise JSONPointerError(f"'{value}' is not a valid JSON pointer")
-                self._keys.extend(self.unescape(token) for token in value.split('/')[1:])
+                keys.extend(cls.unescape(token) for token in value.split('/')[1:])
 
             elif isinstance(value, JSONPointer):
-                self._keys.extend(value._keys)
-
-            elif isinstance(value, Iterable) and all(isinstance(k, str) for k in value):
-                self._keys.extend(value)
+                keys.extend(value._keys)
 
             else:
-                raise TypeError("Expecting str or Iterable[str]")
+                if type(value) is not list and type(value) is not tuple:
+                    if not isinstance(value, Iterable):
+                        raise TypeError("Expecting str or Iterable[str]")
+                    # materialize the keys, so that an iterator is only consumed once
+                    value = list(value)
+
+                if not all(isinstance(k, str) for k in value):
+                    raise TypeError("Expecting str or Iterable[str]")
+                keys.extend(value)
+
+        return cls._from_keys(keys)
 
+    @classmethod
+    def _from_keys(cls, keys: List[str]) -> 'JSONPointer':
+        """Create a :class:`JSONPointer` instance directly from a list of
+        unescaped keys, bypassing argument parsing. The list is taken over
+        by the new instance, and must not be modified afterwards."""
+        self = object.__new__(cls)
+        self._keys = keys
+        self._indices = None
+        self._str = None
+        self._hash = None
+        self._uri_fragment = None
         return self
 
     @overload
@@ -95,7 +117,7 @@ class JSONPointer(Sequence[str]):
         if isinstance(index, int):
             return self._keys[index]
         if isinstance(index, slice):
-            return JSONPointer(self._keys[index])
+            return JSONPointer._from_keys(self._keys[index])
         raise TypeError("Expecting int or slice")
 
     def __len__(self) -> int:
@@ -113,7 +135,10 @@ class JSONPointer(Sequence[str]):
     def __truediv__(self, suffix) -> 'JSONPointer':
         """ self / suffix """
         if isinstance(suffix, str):
-            return JSONPointer(self, (suffix,))
+            pointer = JSONPointer._from_keys(self._keys + [suffix])
+            if self._str is not None:
+                pointer._str = f'{self._str}/{self.escape(suffix)}'
+            return pointer
         if isinstance(suffix, Iterable):
             return JSONPointer(self, suffix)
         return NotImplemented
@@ -126,11 +151,15 @@ class JSONPointer(Sequence[str]):
 
     def __hash__(self) -> int:
         """ hash(self) """
-        return hash(tuple(self._keys))
+        if self._hash is None:
+            self._hash = hash(tuple(self._keys))
+        return self._hash
 
     def __str__(self) -> str:
         """ str(self) """
-        return ''.join([f'/{self.escape(key)}' for key in self._keys])
+        if self._str is None:
+            self._str = ''.join([f'/{self.escape(key)}' for key in self._keys])
+        return self._str
 
     def __repr__(self) -> str:
         """ repr(self) """
@@ -148,30 +177,45 @@ class JSONPointer(Sequence[str]):
             within `document`
         """
 
-        def resolve(value, keys):
-            from jschon.json import JSON
-            if not keys:
-                return value
+        from jschon.json import JSON
+
+        if self._indices is None:
+            # the array index (if any) corresponding to each key
+            self._indices = [
+                int(key) if self._array_index_re.fullmatch(key) else None
+                for key in self._keys
+            ]
+
+        value = document
+        for key, index in zip(self._keys, self._indices):
+            # check for the common concrete types before falling back
+            # to the (much slower) abstract base class checks
+            cls = type(value)
+            if cls is dict:
+                isobject, isarray = True, False
+            elif cls is list or cls is tuple:
+                isobject, isarray = False, True
+            elif isinstance(value, JSON):
+                isobject, isarray = value.type == "object", value.type == "array"
+            else:
+                isobject = isinstance(value, Mapping)
+                isarray = not isobject and isinstance(value, Sequence) and not isinstance(value, str)
 
-            key = keys.popleft()
             try:
-                isjson = isinstance(value, JSON)
-                if isjson and value.type == "object" or \
-                        not isjson and isinstance(value, Mapping):
-                    return resolve(value[key], keys)
+                if isobject:
+                    value = value[key]
+                    continue
 
-                if isjson and value.type == "array" or \
-                        not isjson and isinstance(value, Sequence) and \
-                        not isinstance(value, str) and \
-                        self._array_index_re.fullmatch(key):
-                    return resolve(value[int(key)], keys)
+                if isarray and index is not None:
+                    value = value[index]
+                    continue
 
             except (KeyError, IndexError):
                 pass
 
             raise JSONPointerError(f"Failed to resolve '{self}' against the given document")
 
-        return resolve(document, collections.deque(self._keys))
+        return value
 
     @classmethod
     def parse_uri_fragment(cls, value: str) -> 'JSONPointer':
@@ -205,7 +249,9 @@ class JSONPointer(Sequence[str]):
         # sub-delims    = "!" / "$" / "&" / "'" / "(" / ")"
         #               / "*" / "+" / "," / ";" / "="
 
-        return urllib.parse.quote(str(self), safe="/!$&'()*+,;=")
+        if self._uri_fragment is None:
+            self._uri_fragment = urllib.parse.quote(str(self), safe="/!$&'()*+,;=")
+        return self._uri_fragment
 
     @staticmethod
     def escape(key: str) -> str:
@@ -214,7 +260,12 @@ class JSONPointer(Sequence[str]):
 
         :param key: an unescaped key
         """
-        return key.replace('~', '~0').replace('/', '~1')
+        # each replacement is only applied if needed; most keys need neither
+        if '~' in key:
+            key = key.replace('~', '~0')
+        if '/' in key:
+            key = key.replace('/', '~1')
+        return key
 
     @staticmethod
     def unescape(token: str) -> str:
@@ -223,4 +274,6 @@ class JSONPointer(Sequence[str]):
 
         :param token: an RFC 6901 reference token
         """
+        if '~' not in token:
+            return token
         return token.replace('~1', '/').replace('~0', '~')
@@ -1,4 +1,3 @@
-from collections import deque
 from contextlib import contextmanager
 from enum import Enum
 from typing import (
@@ -9,6 +8,8 @@ from typing import (
     Iterator,
     ContextManager,
     Hashable,
+    Tuple,
+    Any,
     TYPE_CHECKING,
 )
 from uuid import uuid4
@@ -83,6 +84,8 @@ class JSONSchema(JSON):
 
         self._uri: Optional[URI] = uri
         self._metaschema_uri: Optional[URI] = metaschema_uri
+        self._base_uri: Optional[URI] = None
+        self._base_uri_cached: bool = False
 
         self.keywords: Dict[str, Keyword] = {}
         """A dictionary of the schema's :class:`~jschon.vocabulary.Keyword`
@@ -171,6 +174,24 @@ class JSONSchema(JSON):
                     if isinstance(item, JSONSchema):
                         item._resolve_references()
 
+    def _clear_base_uri(self) -> None:
+        """Discard the cached base URI of this schema and of any subschemas
+        that inherit it, i.e. those that do not have a URI of their own."""
+        self._base_uri_cached = False
+        for kw in self.keywords.values():
+            if isinstance(kw.json, JSONSchema):
+                subschemas = [kw.json]
+            elif kw.json.type == "array":
+                subschemas = [item for item in kw.json if isinstance(item, JSONSchema)]
+            elif kw.json.type == "object":
+                subschemas = [item for item in kw.json.values() if isinstance(item, JSONSchema)]
+            else:
+                continue
+
+            for subschema in subschemas:
+                if subschema._uri is None:
+                    subschema._clear_base_uri()
+
     @staticmethod
     def _resolve_dependencies(kwclasses: Dict[str, 'KeywordClass']) -> Iterator['KeywordClass']:
         dependencies = {
@@ -215,7 +236,7 @@ class JSONSchema(JSON):
 
         else:
             for key, keyword in self.keywords.items():
-                if keyword.can_evaluate(instance):
+                if keyword.evaluable and keyword.can_evaluate(instance):
                     with scope(instance, key, self) as subscope:
                         keyword.evaluate(instance, subscope)
 
@@ -282,10 +303,15 @@ class JSONSchema(JSON):
         The base URI is obtained by searching up the schema tree
         for a schema URI, and removing any fragment.
         """
-        if self._uri is not None:
-            return self._uri.copy(fragment=False)
-        if self.parentschema is not None:
-            return self.parentschema.base_uri
+        if not self._base_uri_cached:
+            if self._uri is not None:
+                self._base_uri = self._uri.copy(fragment=False)
+            else:
+                parentschema = self.parentschema
+                self._base_uri = parentschema.base_uri if parentschema is not None else None
+            self._base_uri_cached = True
+
+        return self._base_uri
 
     @property
     def uri(self) -> Optional[URI]:
@@ -302,6 +328,7 @@ class JSONSchema(JSON):
                 self.catalogue.del_schema(self._uri, session=self.session)
 
             self._uri = value
+            self._clear_base_uri()
 
             if self._uri is not None:
                 self.catalogue.add_schema(
@@ -317,13 +344,14 @@ class JSONSchema(JSON):
         if self._uri is not None:
             return self._uri
 
-        keys = deque()
+        keys = []
         node = self
         while node.parent is not None:
-            keys.appendleft(node.key)
+            keys += [node.key]
             node = node.parent
 
             if isinstance(node, JSONSchema) and node._uri is not None:
+                keys.reverse()
                 fragment = node._uri.fragment
                 if fragment:
                     relpath = JSONPointer.parse_uri_fragment(fragment) / keys
@@ -352,7 +380,9 @@ class Scope:
         self.parent: Optional[Scope] = parent
         self.children: Dict[JSONPointer, Dict[str, Scope]] = {}
         self.annotation: AnyJSONCompatible = None
-        self.error: Optional[str] = None
+        self._error: Optional[str] = None
+        self._error_args: Tuple[Any, ...] = ()
+        self._absolute_uri: Optional[URI] = None
         self._valid = True
         self._assert = True
         self._discard = False
@@ -397,10 +427,15 @@ class Scope:
         """Set an annotation on the scope."""
         self.annotation = value
 
-    def fail(self, error: str = None) -> None:
-        """Flag the scope as invalid, optionally with an error message."""
+    def fail(self, error: str = None, *args: Any) -> None:
+        """Flag the scope as invalid, optionally with an error message.
+
+        If `args` are given, `error` is a :meth:`str.format` template,
+        which is only formatted with `args` when the message is read.
+        """
         self._valid = False
-        self.error = error
+        self._error = error
+        self._error_args = args
 
     def pass_(self) -> None:
         """Flag the scope as valid.
@@ -409,7 +444,8 @@ class Scope:
         to be called by a keyword when it must reverse a scope failure.
         """
         self._valid = True
-        self.error = None
+        self._error = None
+        self._error_args = ()
 
     def noassert(self) -> None:
         """Indicate that the scope's validity should not affect its
@@ -420,6 +456,22 @@ class Scope:
         """Indicate that the scope should be ignored and discarded."""
         self._discard = True
 
+    @property
+    def error(self) -> Optional[str]:
+        """Return the error message of the scope, if any.
+
+        :rtype: Optional[str]
+        """
+        if self._error_args:
+            self._error = self._error.format(*self._error_args)
+            self._error_args = ()
+        return self._error
+
+    @error.setter
+    def error(self, value: Optional[str]) -> None:
+        self._error = value
+        self._error_args = ()
+
     @property
     def valid(self) -> bool:
         """Return the validation result of the scope.
@@ -444,15 +496,18 @@ class Scope:
 
     @property
     def absolute_uri(self) -> Optional[URI]:
-        schema_uri = self.schema.canonical_uri
-        if (schema_uri) is not None:
-            fragment = schema_uri.fragment
-            if fragment:
-                relpath = JSONPointer.parse_uri_fragment(
-                    fragment) / self.relpath
-            else:
-                relpath = self.relpath
-            return schema_uri.copy(fragment=relpath.uri_fragment())
+        if self._absolute_uri is None:
+            schema_uri = self.schema.canonical_uri
+            if (schema_uri) is not None:
+                fragment = schema_uri.fragment
+                if fragment:
+                    relpath = JSONPointer.parse_uri_fragment(
+                        fragment) / self.relpath
+                else:
+                    relpath = self.relpath
+                self._absolute_uri = schema_uri.copy(fragment=relpath.uri_fragment())
+
+        return self._absolute_uri
 
     def iter_children(self, instance: JSON = None) -> Iterator['Scope']:
         """Return an iterator over child scopes of this scope, optionally
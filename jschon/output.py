@@ -18,26 +18,30 @@ class OutputFormatter:
 
     @staticmethod
     def basic(scope: Scope) -> Dict[str, AnyJSONCompatible]:
-        def visit(node: Scope):
+        valid = scope.valid
+        msgkey = "annotation" if valid else "error"
+        childkey = "annotations" if valid else "errors"
+
+        # depth-first, pre-order traversal; children are pushed in
+        # reverse so that they are visited in order
+        results = []
+        stack = [scope]
+        while stack:
+            node = stack.pop()
             if node.valid is valid:
                 msgval = getattr(node, msgkey)
                 if msgval is not None:
-                    yield {
+                    results += [{
                         "instanceLocation": str(node.instpath),
                         "keywordLocation": str(node.path),
                         "absoluteKeywordLocation": str(node.absolute_uri),
                         msgkey: msgval,
-                    }
-                for child in node.iter_children():
-                    yield from visit(child)
-
-        valid = scope.valid
-        msgkey = "annotation" if valid else "error"
-        childkey = "annotations" if valid else "errors"
+                    }]
+                stack.extend(reversed(list(node.iter_children())))
 
         return {
             "valid": valid,
-            childkey: [result for result in visit(scope)],
+            childkey: results,
         }
 
     @staticmethod
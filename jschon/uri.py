@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import Tuple, Optional
+
 import rfc3986
 import rfc3986.exceptions
 import rfc3986.misc
@@ -9,6 +12,29 @@ __all__ = [
     'URI',
 ]
 
+# rfc3986 validators are stateless once configured, so we build them once
+_validator = rfc3986.validators.Validator()
+_scheme_validator = rfc3986.validators.Validator().require_presence_of('scheme')
+
+
+@lru_cache(maxsize=4096)
+def _validation_error(
+        components: Tuple[Optional[str], ...],
+        require_scheme: bool,
+) -> Optional[rfc3986.exceptions.ValidationError]:
+    """Check the syntax of a URI, given as a tuple of its components,
+    returning the validation error if there is one.
+
+    A plain tuple is used as the cache key, since :class:`rfc3986.URIReference`
+    equality falls back to comparing normalized forms.
+    """
+    validator = _scheme_validator if require_scheme else _validator
+    try:
+        validator.validate(rfc3986.URIReference(*components))
+    except rfc3986.exceptions.ValidationError as e:
+        # drop the traceback so that the cache does not keep frames alive
+        return e.with_traceback(None)
+
 
 class URI:
     def __init__(self, value: str) -> None:
@@ -100,16 +126,12 @@ class URI:
 
         :raise URIError: if self fails validation
         """
-        validator = rfc3986.validators.Validator()
-        if require_scheme:
-            validator = validator.require_presence_of('scheme')
-        try:
-            validator.validate(self._uriref)
-        except rfc3986.exceptions.ValidationError as e:
+        error = _validation_error(tuple(self._uriref), require_scheme)
+        if error is not None:
             msg = f"'{self}' is not a valid URI"
             if require_scheme:
                 msg += " or does not contain a scheme"
-            raise URIError(msg) from e
+            raise URIError(msg) from error
 
         if require_normalized and self._uriref != self._uriref.normalize():
             raise URIError(f"'{self}' is not normalized")
@@ -65,6 +65,18 @@ class Keyword:
     types: Optional[Union[str, Tuple[str, ...]]] = None
     depends: Optional[Union[str, Tuple[str, ...]]] = None
 
+    # set to False on keywords that never take part in evaluation, e.g.
+    # identifiers and containers; the evaluation loop checks this before
+    # calling can_evaluate, so such keywords are skipped without a call
+    evaluable: bool = True
+
+    _types: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # normalize types once per class rather than on every can_evaluate call
+        cls._types = tuplify(cls.types)
+
     def __init__(self, parentschema: JSONSchema, value: AnyJSONCompatible):
         self.applicator_cls = None
         for applicator_cls in (Applicator, ArrayApplicator, PropertyApplicator):
@@ -80,7 +92,10 @@ class Keyword:
         self.parentschema: JSONSchema = parentschema
 
     def can_evaluate(self, instance: JSON) -> bool:
-        types = tuplify(self.types)
+        if not self.evaluable:
+            return False
+
+        types = self._types
         if self.types is None or instance.type in types:
             return True
 
@@ -1,7 +1,8 @@
 import re
+from typing import Mapping
 
-from jschon.json import JSON
-from jschon.jsonschema import Scope
+from jschon.json import JSON, AnyJSONCompatible
+from jschon.jsonschema import JSONSchema, Scope
 from jschon.vocabulary import Keyword, Applicator, ArrayApplicator, PropertyApplicator
 
 __all__ = [
@@ -270,12 +271,16 @@ class PatternPropertiesKeyword(Keyword, PropertyApplicator):
     key = "patternProperties"
     types = "object"
 
+    def __init__(self, parentschema: JSONSchema, value: Mapping[str, AnyJSONCompatible]):
+        super().__init__(parentschema, value)
+        self.regexes = {regex: re.compile(regex) for regex in value}
+
     def evaluate(self, instance: JSON, scope: Scope) -> None:
         matched_names = set()
         err_names = []
         for name, item in instance.items():
             for regex, subschema in self.json.items():
-                if re.search(regex, name) is not None:
+                if self.regexes[regex].search(name) is not None:
                     with scope(item, regex) as subscope:
                         subschema.evaluate(item, subscope)
                         if subscope.passed:
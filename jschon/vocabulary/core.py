@@ -1,4 +1,6 @@
-from typing import Mapping
+from functools import lru_cache
+from typing import Mapping, MutableMapping, Tuple
+from weakref import WeakValueDictionary
 
 from jschon.exceptions import JSONSchemaError, URIError, CatalogueError
 from jschon.json import JSON
@@ -19,25 +21,32 @@ __all__ = [
 ]
 
 
+@lru_cache(maxsize=4096)
+def _parse_uri(value: str) -> URI:
+    """Parse a URI string. :class:`~jschon.uri.URI` objects are immutable,
+    so the result can be shared by all keywords with the same value."""
+    return URI(value)
+
+
 class SchemaKeyword(Keyword):
     key = "$schema"
+    evaluable = False
 
     def __init__(self, parentschema: JSONSchema, value: str):
         super().__init__(parentschema, value)
 
         try:
-            URI(value).validate(require_scheme=True, require_normalized=True)
+            uri = _parse_uri(value)
+            uri.validate(require_scheme=True, require_normalized=True)
         except URIError as e:
             raise JSONSchemaError from e
 
-        parentschema.metaschema_uri = URI(value)
-
-    def can_evaluate(self, instance: JSON) -> bool:
-        return False
+        parentschema.metaschema_uri = uri
 
 
 class VocabularyKeyword(Keyword):
     key = "$vocabulary"
+    evaluable = False
 
     def __init__(self, parentschema: JSONSchema, value: Mapping[str, bool]):
         super().__init__(parentschema, value)
@@ -50,31 +59,32 @@ class VocabularyKeyword(Keyword):
                 value[core_vocab_uri] is not True:
             raise JSONSchemaError(f'The "$vocabulary" keyword must list the core vocabulary with a value of true')
 
+        kwclasses = {}
         for vocab_uri, vocab_required in value.items():
             try:
-                vocab_uri = URI(vocab_uri)
+                vocab_uri = _parse_uri(vocab_uri)
                 vocab_uri.validate(require_scheme=True, require_normalized=True)
             except URIError as e:
                 raise JSONSchemaError from e
 
             try:
                 vocabulary = parentschema.catalogue.get_vocabulary(vocab_uri)
-                parentschema.kwclasses.update(vocabulary.kwclasses)
+                kwclasses.update(vocabulary.kwclasses)
             except CatalogueError:
                 if vocab_required:
                     raise JSONSchemaError(f"The metaschema requires an unrecognized vocabulary '{vocab_uri}'")
 
-    def can_evaluate(self, instance: JSON) -> bool:
-        return False
+        parentschema.kwclasses.update(kwclasses)
 
 
 class IdKeyword(Keyword):
     key = "$id"
+    evaluable = False
 
     def __init__(self, parentschema: JSONSchema, value: str):
         super().__init__(parentschema, value)
 
-        uri = URI(value)
+        uri = _parse_uri(value)
         uri.validate(require_normalized=True, allow_fragment=False)
         if not uri.is_absolute():
             base_uri = parentschema.base_uri
@@ -85,9 +95,6 @@ class IdKeyword(Keyword):
 
         parentschema.uri = uri
 
-    def can_evaluate(self, instance: JSON) -> bool:
-        return False
-
 
 class RefKeyword(Keyword):
     key = "$ref"
@@ -95,9 +102,10 @@ class RefKeyword(Keyword):
     def __init__(self, parentschema: JSONSchema, value: str):
         super().__init__(parentschema, value)
         self.refschema = None
+        self._target_evaluate = None
 
     def resolve(self) -> None:
-        uri = URI(self.json.value)
+        uri = _parse_uri(self.json.value)
         if not uri.has_absolute_base():
             base_uri = self.parentschema.base_uri
             if base_uri is not None:
@@ -108,13 +116,16 @@ class RefKeyword(Keyword):
         self.refschema = self.parentschema.catalogue.get_schema(
             uri, metaschema_uri=self.parentschema.metaschema_uri, session=self.parentschema.session
         )
+        # the target is fixed once resolved, so bind its evaluate method up front
+        self._target_evaluate = self.refschema.evaluate
 
     def evaluate(self, instance: JSON, scope: Scope) -> None:
-        self.refschema.evaluate(instance, scope)
+        self._target_evaluate(instance, scope)
 
 
 class AnchorKeyword(Keyword):
     key = "$anchor"
+    evaluable = False
 
     def __init__(self, parentschema: JSONSchema, value: str):
         super().__init__(parentschema, value)
@@ -127,9 +138,6 @@ class AnchorKeyword(Keyword):
 
         parentschema.catalogue.add_schema(uri, parentschema, session=parentschema.session)
 
-    def can_evaluate(self, instance: JSON) -> bool:
-        return False
-
 
 class DynamicRefKeyword(Keyword):
     key = "$dynamicRef"
@@ -139,16 +147,22 @@ class DynamicRefKeyword(Keyword):
 
         # this is not required by the spec, but it doesn't make sense
         # for a $dynamicRef *not* to end in a plain-name fragment
-        fragment = URI(value).fragment
+        fragment = _parse_uri(value).fragment
         if fragment is None or '/' in fragment:
             raise JSONSchemaError('The value for "$dynamicRef" must end in a plain-name fragment')
 
         self.fragment = fragment
         self.refschema = None
         self.dynamic = False
+        self._target_evaluate = None
+        self._fragment_uri = _parse_uri(f"#{fragment}")
+        # weakly referenced, so that the memo does not keep schemas alive
+        # after they are dropped from the catalogue, e.g. on session teardown
+        self._dynamic_targets: MutableMapping[Tuple[URI, ...], JSONSchema] = WeakValueDictionary()
+        self._dynamic_targets_version = None
 
     def resolve(self) -> None:
-        uri = URI(self.json.value)
+        uri = _parse_uri(self.json.value)
         if not uri.has_absolute_base():
             base_uri = self.parentschema.base_uri
             if base_uri is not None:
@@ -162,37 +176,61 @@ class DynamicRefKeyword(Keyword):
         dynamic_anchor = self.refschema.get("$dynamicAnchor")
         if dynamic_anchor and dynamic_anchor.value == self.fragment:
             self.dynamic = True
+        else:
+            # a non-dynamic reference behaves like $ref, with a fixed target
+            self._target_evaluate = self.refschema.evaluate
 
     def evaluate(self, instance: JSON, scope: Scope) -> None:
+        if not self.dynamic:
+            self._target_evaluate(instance, scope)
+            return
+
         refschema = self.refschema
 
-        if self.dynamic:
-            target_scope = scope
-            checked_uris = set()
-
-            while target_scope is not None:
-                base_uri = target_scope.schema.base_uri
-                if base_uri is not None and base_uri not in checked_uris:
-                    checked_uris |= {base_uri}
-                    target_uri = URI(f"#{self.fragment}").resolve(base_uri)
-                    try:
-                        found_schema = self.parentschema.catalogue.get_schema(
-                            target_uri, session=self.parentschema.session
-                        )
-                        dynamic_anchor = found_schema.get("$dynamicAnchor")
-                        if dynamic_anchor and \
-                                dynamic_anchor.value == self.fragment:
-                            refschema = found_schema
-                    except CatalogueError:
-                        pass
-
-                target_scope = target_scope.parent
+        # the distinct base URIs of the dynamic scope, innermost first
+        base_uris = []
+        checked_uris = set()
+        target_scope = scope
+        while target_scope is not None:
+            base_uri = target_scope.schema.base_uri
+            if base_uri is not None and base_uri not in checked_uris:
+                checked_uris.add(base_uri)
+                base_uris += [base_uri]
+            target_scope = target_scope.parent
+
+        # the outcome depends only on the base URIs in the dynamic scope
+        # and on the catalogue contents, so it is memoized on the former
+        # and discarded whenever the latter changes
+        catalogue = self.parentschema.catalogue
+        if self._dynamic_targets_version != catalogue.schema_cache_version:
+            self._dynamic_targets.clear()
+            self._dynamic_targets_version = catalogue.schema_cache_version
+
+        dynamic_key = tuple(base_uris)
+        try:
+            refschema = self._dynamic_targets[dynamic_key]
+        except KeyError:
+            for base_uri in base_uris:
+                target_uri = self._fragment_uri.resolve(base_uri)
+                try:
+                    found_schema = catalogue.get_schema(
+                        target_uri, session=self.parentschema.session
+                    )
+                    dynamic_anchor = found_schema.get("$dynamicAnchor")
+                    if dynamic_anchor and \
+                            dynamic_anchor.value == self.fragment:
+                        refschema = found_schema
+                except CatalogueError:
+                    pass
+
+            self._dynamic_targets[dynamic_key] = refschema
 
         refschema.evaluate(instance, scope)
 
 
 class DynamicAnchorKeyword(Keyword):
     key = "$dynamicAnchor"
+    evaluable = False
 
     def __init__(self, parentschema: JSONSchema, value: str):
         super().__init__(parentschema, value)
@@ -205,19 +243,12 @@ class DynamicAnchorKeyword(Keyword):
 
         parentschema.catalogue.add_schema(uri, parentschema, session=parentschema.session)
 
-    def can_evaluate(self, instance: JSON) -> bool:
-        return False
-
 
 class DefsKeyword(Keyword, PropertyApplicator):
     key = "$defs"
-
-    def can_evaluate(self, instance: JSON) -> bool:
-        return False
+    evaluable = False
 
 
 class CommentKeyword(Keyword):
     key = "$comment"
-
-    def can_evaluate(self, instance: JSON) -> bool:
-        return False
+    evaluable = False
@@ -1,7 +1,8 @@
 import decimal
 import re
+from typing import Hashable, List, Union
 
-from jschon.json import JSON
+from jschon.json import JSON, AnyJSONCompatible
 from jschon.jsonschema import Scope, JSONSchema
 from jschon.utils import tuplify
 from jschon.vocabulary import Keyword
@@ -30,11 +31,25 @@ __all__ = [
 ]
 
 
+def _hashable(instance: JSON) -> Hashable:
+    """Return a hashable key for `instance`, such that two JSON instances
+    have equal keys if and only if they compare equal."""
+    if instance.type == "array":
+        return "array", tuple(_hashable(item) for item in instance.value)
+    if instance.type == "object":
+        return "object", frozenset((k, _hashable(v)) for k, v in instance.value.items())
+    return instance.type, instance.value
+
+
 class TypeKeyword(Keyword):
     key = "type"
 
+    def __init__(self, parentschema: JSONSchema, value: Union[str, List[str]]):
+        super().__init__(parentschema, value)
+        self._allowed_types = tuplify(value)
+
     def evaluate(self, instance: JSON, scope: Scope) -> None:
-        types = tuplify(self.json.value)
+        types = self._allowed_types
         if instance.type in types:
             valid = True
         elif instance.type == "number" and "integer" in types:
@@ -43,15 +58,19 @@ class TypeKeyword(Keyword):
             valid = False
 
         if not valid:
-            scope.fail(f"The instance must be of type {self.json}")
+            scope.fail("The instance must be of type {}", self.json)
 
 
 class EnumKeyword(Keyword):
     key = "enum"
 
+    def __init__(self, parentschema: JSONSchema, value: List[AnyJSONCompatible]):
+        super().__init__(parentschema, value)
+        self._hashables = frozenset(_hashable(item) for item in self.json)
+
     def evaluate(self, instance: JSON, scope: Scope) -> None:
-        if instance not in self.json:
-            scope.fail(f"The value must be one of {self.json}")
+        if _hashable(instance) not in self._hashables:
+            scope.fail("The value must be one of {}", self.json)
 
 
 class ConstKeyword(Keyword):
@@ -59,7 +78,7 @@ class ConstKeyword(Keyword):
 
     def evaluate(self, instance: JSON, scope: Scope) -> None:
         if instance != self.json:
-            scope.fail(f"The value must be equal to {self.json}")
+            scope.fail("The value must be equal to {}", self.json)
 
 
 class MultipleOfKeyword(Keyword):
@@ -69,9 +88,9 @@ class MultipleOfKeyword(Keyword):
     def evaluate(self, instance: JSON, scope: Scope) -> None:
         try:
             if instance.value % self.json.value != 0:
-                scope.fail(f"The value must be a multiple of {self.json}")
+                scope.fail("The value must be a multiple of {}", self.json)
         except decimal.InvalidOperation:
-            scope.fail(f"Invalid operation: {instance} % {self.json}")
+            scope.fail("Invalid operation: {} % {}", instance, self.json)
 
 
 class MaximumKeyword(Keyword):
@@ -80,7 +99,7 @@ class MaximumKeyword(Keyword):
 
     def evaluate(self, instance: JSON, scope: Scope) -> None:
         if instance > self.json:
-            scope.fail(f"The value may not be greater than {self.json}")
+            scope.fail("The value may not be greater than {}", self.json)
 
 
 class ExclusiveMaximumKeyword(Keyword):
@@ -89,7 +108,7 @@ class ExclusiveMaximumKeyword(Keyword):
 
     def evaluate(self, instance: JSON, scope: Scope) -> None:
         if instance >= self.json:
-            scope.fail(f"The value must be less than {self.json}")
+            scope.fail("The value must be less than {}", self.json)
 
 
 class MinimumKeyword(Keyword):
@@ -98,7 +117,7 @@ class MinimumKeyword(Keyword):
 
     def evaluate(self, instance: JSON, scope: Scope) -> None:
         if instance < self.json:
-            scope.fail(f"The value may not be less than {self.json}")
+            scope.fail("The value may not be less than {}", self.json)
 
 
 class ExclusiveMinimumKeyword(Keyword):
@@ -107,7 +126,7 @@ class ExclusiveMinimumKeyword(Keyword):
 
     def evaluate(self, instance: JSON, scope: Scope) -> None:
         if instance <= self.json:
-            scope.fail(f"The value must be greater than {self.json}")
+            scope.fail("The value must be greater than {}", self.json)
 
 
 class MaxLengthKeyword(Keyword):
@@ -116,7 +135,7 @@ class MaxLengthKeyword(Keyword):
 
     def evaluate(self, instance: JSON, scope: Scope) -> None:
         if len(instance) > self.json:
-            scope.fail(f"The text is too long (maximum {self.json} characters)")
+            scope.fail("The text is too long (maximum {} characters)", self.json)
 
 
 class MinLengthKeyword(Keyword):
@@ -125,7 +144,7 @@ class MinLengthKeyword(Keyword):
 
     def evaluate(self, instance: JSON, scope: Scope) -> None:
         if len(instance) < self.json:
-            scope.fail(f"The text is too short (minimum {self.json} characters)")
+            scope.fail("The text is too short (minimum {} characters)", self.json)
 
 
 class PatternKeyword(Keyword):
@@ -138,7 +157,7 @@ class PatternKeyword(Keyword):
 
     def evaluate(self, instance: JSON, scope: Scope) -> None:
         if self.regex.search(instance.value) is None:
-            scope.fail(f"The text must match the regular expression {self.json}")
+            scope.fail("The text must match the regular expression {}", self.json)
 
 
 class MaxItemsKeyword(Keyword):
@@ -147,7 +166,7 @@ class MaxItemsKeyword(Keyword):
 
     def evaluate(self, instance: JSON, scope: Scope) -> None:
         if len(instance) > self.json:
-            scope.fail(f"The array has too many elements (maximum {self.json})")
+            scope.fail("The array has too many elements (maximum {})", self.json)
 
 
 class MinItemsKeyword(Keyword):
@@ -156,7 +175,7 @@ class MinItemsKeyword(Keyword):
 
     def evaluate(self, instance: JSON, scope: Scope) -> None:
         if len(instance) < self.json:
-            scope.fail(f"The array has too few elements (minimum {self.json})")
+            scope.fail("The array has too few elements (minimum {})", self.json)
 
 
 class UniqueItemsKeyword(Keyword):
@@ -167,13 +186,13 @@ class UniqueItemsKeyword(Keyword):
         if not self.json.value:
             return
 
-        uniquified = []
+        seen = set()
         for item in instance:
-            if item not in uniquified:
-                uniquified += [item]
-
-        if len(instance) > len(uniquified):
-            scope.fail("The array's elements must all be unique")
+            key = _hashable(item)
+            if key in seen:
+                scope.fail("The array's elements must all be unique")
+                return
+            seen.add(key)
 
 
 class MaxContainsKeyword(Keyword):
@@ -185,7 +204,7 @@ class MaxContainsKeyword(Keyword):
         contains = scope.sibling(instance, "contains")
         if contains and contains.annotation is not None and len(contains.annotation) > self.json:
             scope.fail('The array has too many elements matching the '
-                        f'"contains" subschema (maximum {self.json})')
+                       '"contains" subschema (maximum {})', self.json)
 
 
 class MinContainsKeyword(Keyword):
@@ -209,7 +228,7 @@ class MinContainsKeyword(Keyword):
 
             if not valid:
                 scope.fail('The array has too few elements matching the '
-                           f'"contains" subschema (minimum {self.json})')
+                           '"contains" subschema (minimum {})', self.json)
 
 
 class MaxPropertiesKeyword(Keyword):
@@ -218,7 +237,7 @@ class MaxPropertiesKeyword(Keyword):
 
     def evaluate(self, instance: JSON, scope: Scope) -> None:
         if len(instance) > self.json:
-            scope.fail(f"The object has too many properties (maximum {self.json})")
+            scope.fail("The object has too many properties (maximum {})", self.json)
 
 
 class MinPropertiesKeyword(Keyword):
@@ -227,7 +246,7 @@ class MinPropertiesKeyword(Keyword):
 
     def evaluate(self, instance: JSON, scope: Scope) -> None:
         if len(instance) < self.json:
-            scope.fail(f"The object has too few properties (minimum {self.json})")
+            scope.fail("The object has too few properties (minimum {})", self.json)
 
 
 class RequiredKeyword(Keyword):
@@ -235,9 +254,12 @@ class RequiredKeyword(Keyword):
     types = "object"
 
     def evaluate(self, instance: JSON, scope: Scope) -> None:
-        missing = [name for name in self.json if name.value not in instance]
-        if missing:
-            scope.fail(f"The object is missing required properties {missing}")
+        properties = instance.value
+        if all(name.value in properties for name in self.json):
+            return
+
+        missing = [name for name in self.json if name.value not in properties]
+        scope.fail("The object is missing required properties {}", missing)
 
 
 class DependentRequiredKeyword(Keyword):
@@ -245,12 +267,11 @@ class DependentRequiredKeyword(Keyword):
     types = "object"
 
     def evaluate(self, instance: JSON, scope: Scope) -> None:
+        properties = instance.value
         missing = {}
         for name, dependents in self.json.items():
-            if name in instance:
-                missing_deps = [dep for dep in dependents if dep.value not in instance]
-                if missing_deps:
-                    missing[name] = missing_deps
+            if name in properties and not all(dep.value in properties for dep in dependents):
+                missing[name] = [dep for dep in dependents if dep.value not in properties]
 
         if missing:
-            scope.fail(f"The object is missing dependent properties {missing}")
+            scope.fail("The object is missing dependent properties {}", missing)
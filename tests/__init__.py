@@ -1,8 +1,18 @@
-from jschon import URI
+from functools import lru_cache
+
+from jschon import URI, JSONSchema
 
 metaschema_uri_2019_09 = URI("https://json-schema.org/draft/2019-09/schema")
 metaschema_uri_2020_12 = URI("https://json-schema.org/draft/2020-12/schema")
 
+
+@lru_cache()
+def true_schema():
+    # created on first use rather than at import time, since the
+    # default catalogue is set up by the session fixture in conftest
+    return JSONSchema(True)
+
+
 example_schema = {
     "$id": "dynamicRef8_main.json",
     "$defs": {
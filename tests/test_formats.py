@@ -3,9 +3,10 @@ import ipaddress
 import pytest
 from hypothesis import given, strategies as hs
 
-from jschon import JSON, JSONPointer, JSONPointerError, JSONSchema
+from jschon import JSON, JSONPointer, JSONPointerError
 from jschon.jsonschema import Scope
 from jschon.vocabulary.format import FormatKeyword
+from tests import true_schema
 from tests.strategies import jsonpointer
 
 
@@ -39,7 +40,7 @@ def jsonpointer_validator(value):
 
 
 def evaluate(format_attr, instval, assert_=True):
-    schema = JSONSchema(True)
+    schema = true_schema()
     scope = Scope(schema)
     FormatKeyword(schema, format_attr).evaluate(JSON(instval), scope)
     assert scope.annotation == format_attr
@@ -17,11 +17,13 @@ def test_create_jsonpointer(values: List[Union[str, List[str]]]):
     ptr1 = JSONPointer(*values)
     ptr2 = JSONPointer(keys)
     ptr3 = JSONPointer(ptr0)
+    ptr6 = JSONPointer(key for key in keys)
     ptr4 = JSONPointer() if keys else JSONPointer('/')
     ptr5 = JSONPointer('/', keys)
     assert ptr0 == ptr1
     assert ptr0 == ptr2
     assert ptr0 == ptr3
+    assert ptr0 == ptr6
     assert ptr0 != ptr4
     assert ptr0 != ptr5
     assert JSONPointer(ptr0, keys, *values) == JSONPointer(*values, keys, ptr0)
@@ -36,6 +38,17 @@ def test_create_jsonpointer(values: List[Union[str, List[str]]]):
     assert bool(ptr0) == bool(keys)
     assert eval(repr(ptr0)) == ptr0
 
+    with pytest.raises(TypeError):
+        JSONPointer(keys + [0])
+    with pytest.raises(TypeError):
+        JSONPointer(0)
+
+
+@pytest.mark.parametrize('value', ['a', 'a/b', '~0', '/~', '/a~', '/~2', '/a/~/b', '/~01/~'])
+def test_invalid_jsonpointer(value):
+    with pytest.raises(JSONPointerError):
+        JSONPointer(value)
+
 
 @given(jsonpointer, jsonpointer_key)
 def test_extend_jsonpointer_one_key(value, newkey):
@@ -82,6 +95,12 @@ def test_evaluate_jsonpointer(value, testkey):
             JSONPointer('/-').evaluate(value)
         with pytest.raises(JSONPointerError):
             JSONPointer('/').evaluate(value)
+        with pytest.raises(JSONPointerError):
+            JSONPointer(f'/{len(value)}').evaluate(JSON(value))
+        with pytest.raises(JSONPointerError):
+            JSONPointer('/-').evaluate(JSON(value))
+        with pytest.raises(JSONPointerError):
+            JSONPointer('/-1').evaluate(JSON(value))
     elif isinstance(value, dict):
         if testkey not in value:
             with pytest.raises(JSONPointerError):
@@ -230,3 +230,12 @@ def test_contains_if_output(input, output):
     schema = JSONSchema(contains_if_schema, metaschema_uri=metaschema_uri_2020_12)
     result = schema.evaluate(JSON(input)).output('basic')
     assert result == output
+
+
+def test_scope_error_assignment():
+    scope = JSONSchema(True).evaluate(JSON(None))
+    scope.fail("The value must be a multiple of {}", 2)
+    assert scope.error == "The value must be a multiple of 2"
+    scope.fail("The value must be a multiple of {}", 3)
+    scope.error = "Custom error"
+    assert scope.error == "Custom error"
@@ -1,4 +1,6 @@
+import gc
 import urllib.parse
+import weakref
 
 import pytest
 from hypothesis import given
@@ -173,6 +175,17 @@ def test_base_uri(ptr: str, base_uri: str):
     assert schema.base_uri == URI(base_uri)
 
 
+def test_base_uri_follows_uri_change():
+    rootschema = JSONSchema(id_example, metaschema_uri=metaschema_uri_2020_12)
+    schema_a = rootschema["$defs"]["A"]
+    schema_x = rootschema["$defs"]["B"]["$defs"]["X"]
+    assert schema_a.base_uri == URI('https://example.com/root.json')
+    assert schema_x.base_uri == URI('https://example.com/other.json')
+    rootschema.uri = URI('https://example.com/moved.json')
+    assert schema_a.base_uri == URI('https://example.com/moved.json')
+    assert schema_x.base_uri == URI('https://example.com/other.json')
+
+
 @pytest.mark.parametrize('ptr, uri, canonical', [
     ('#', 'https://example.com/root.json', True),
     ('#', 'https://example.com/root.json#', True),
@@ -294,3 +307,85 @@ def test_recursive_schema_extension_2020_12():
     tree_json = JSON(tree_instance_2020_12)
     assert tree_schema.evaluate(tree_json).valid is True
     assert strict_tree_schema.evaluate(tree_json).valid is False
+
+
+dynamic_outer_anchor_uri = URI('https://example.com/dynamic/outer#node')
+
+
+def create_dynamic_schemas(session):
+    JSONSchema({
+        "$id": "https://example.com/dynamic/inner",
+        "$defs": {
+            "node": {"$dynamicAnchor": "node", "type": "string"}
+        },
+        "$dynamicRef": "#node"
+    }, session=session, metaschema_uri=metaschema_uri_2020_12)
+    outer_schema = JSONSchema({
+        "$id": "https://example.com/dynamic/outer",
+        "$ref": "inner"
+    }, session=session, metaschema_uri=metaschema_uri_2020_12)
+    override_schema = JSONSchema({
+        "$dynamicAnchor": "node", "type": "integer"
+    }, session=session, metaschema_uri=metaschema_uri_2020_12)
+    return outer_schema, override_schema
+
+
+def test_dynamic_ref_follows_add_schema(catalogue):
+    with catalogue.session() as session:
+        outer_schema, override_schema = create_dynamic_schemas(session)
+        assert outer_schema.evaluate(JSON(1)).valid is False
+        catalogue.add_schema(dynamic_outer_anchor_uri, override_schema, session=session)
+        assert outer_schema.evaluate(JSON(1)).valid is True
+
+
+def test_dynamic_ref_follows_del_schema(catalogue):
+    with catalogue.session() as session:
+        outer_schema, override_schema = create_dynamic_schemas(session)
+        catalogue.add_schema(dynamic_outer_anchor_uri, override_schema, session=session)
+        assert outer_schema.evaluate(JSON(1)).valid is True
+        catalogue.del_schema(dynamic_outer_anchor_uri, session=session)
+        assert outer_schema.evaluate(JSON(1)).valid is False
+
+
+def test_dynamic_ref_follows_session_teardown(catalogue):
+    with catalogue.session() as session:
+        outer_schema, override_schema = create_dynamic_schemas(session)
+        catalogue.add_schema(dynamic_outer_anchor_uri, override_schema, session=session)
+        assert outer_schema.evaluate(JSON(1)).valid is True
+    assert outer_schema.evaluate(JSON(1)).valid is False
+
+
+@pytest.mark.parametrize('metaschema_uri, value', [
+    (metaschema_uri_2020_12, {
+        "$schema": str(metaschema_uri_2020_12),
+        "$id": "https://example.com/inert",
+        "$anchor": "foo",
+        "$dynamicAnchor": "bar",
+        "$defs": {},
+        "$comment": "nothing to evaluate"
+    }),
+    (metaschema_uri_2019_09, {
+        "$recursiveAnchor": True
+    }),
+])
+def test_non_evaluable_keywords(metaschema_uri, value, catalogue):
+    schema = JSONSchema(value, metaschema_uri=metaschema_uri)
+    for keyword in schema.keywords.values():
+        assert keyword.can_evaluate(JSON(None)) is False
+    metaschema = catalogue.get_schema(metaschema_uri, session='__meta__')
+    assert metaschema.keywords["$vocabulary"].can_evaluate(JSON(None)) is False
+
+
+def test_dynamic_ref_memo_releases_session_schemas(catalogue):
+    with catalogue.session() as session:
+        outer_schema, override_schema = create_dynamic_schemas(session)
+        catalogue.add_schema(dynamic_outer_anchor_uri, override_schema, session=session)
+        assert outer_schema.evaluate(JSON(1)).valid is True
+        inner_schema = outer_schema.keywords["$ref"].refschema
+        dynamic_ref = inner_schema.keywords["$dynamicRef"]
+        override_schema_ref = weakref.ref(override_schema)
+        del override_schema
+
+    gc.collect()
+    assert override_schema_ref() is None
+    assert dynamic_ref.refschema is inner_schema["$defs"]["node"]
@@ -1,9 +1,10 @@
 import urllib.parse
 
 import pytest
+import rfc3986.exceptions
 from hypothesis import given, provisional as hp
 
-from jschon import URI
+from jschon import URI, URIError
 
 
 @given(hp.urls())
@@ -39,3 +40,11 @@ def test_uri_parts():
 ])
 def test_copy_uri(kwargs, result):
     assert URI(example).copy(**kwargs) == URI(result)
+
+
+def test_validate_error_cause():
+    # repeat validation, so that the second failure is served from the cache
+    for _ in range(2):
+        with pytest.raises(URIError) as exc_info:
+            URI('1http://a').validate(require_scheme=True)
+        assert isinstance(exc_info.value.__cause__, rfc3986.exceptions.MissingComponentError)
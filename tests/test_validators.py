@@ -6,25 +6,56 @@ from hypothesis import given
 from jschon import JSON, JSONSchema
 from jschon.jsonschema import Scope
 from jschon.vocabulary.validation import *
-from tests import metaschema_uri_2019_09
+from tests import metaschema_uri_2019_09, true_schema
 from tests.strategies import *
 
+jsonpointer_pattern = re.compile(jsonpointer_regex)
+
 
 def evaluate(kwclass, kwvalue, instval):
-    schema = JSONSchema(True)
+    schema = true_schema()
     scope = Scope(schema)
     kwclass(schema, kwvalue).evaluate(JSON(instval), scope)
     return scope.valid
 
 
-def isequal(x, y):
-    if type(x) is not type(y) and not {type(x), type(y)} <= {int, float, Decimal}:
+def push_list_items(x, y, stack):
+    if len(x) != len(y):
         return False
-    if isinstance(x, list):
-        return len(x) == len(y) and all(isequal(x[i], y[i]) for i in range(len(x)))
-    if isinstance(x, dict):
-        return x.keys() == y.keys() and all(isequal(x[k], y[k]) for k in x)
-    return x == y
+    stack.extend(zip(x, y))
+    return True
+
+
+def push_dict_items(x, y, stack):
+    if x.keys() != y.keys():
+        return False
+    stack.extend((v, y[k]) for k, v in x.items())
+    return True
+
+
+# container types whose items must be compared pairwise; the
+# type check in isequal ensures that both operands share the type
+eq_dispatch = {
+    list: push_list_items,
+    dict: push_dict_items,
+}
+
+
+def isequal(x, y):
+    stack = [(x, y)]
+    while stack:
+        x, y = stack.pop()
+        if x is y:
+            continue
+        if type(x) is not type(y) and not {type(x), type(y)} <= {int, float, Decimal}:
+            return False
+        push_items = eq_dispatch.get(type(x))
+        if push_items is not None:
+            if not push_items(x, y, stack):
+                return False
+        elif x != y:
+            return False
+    return True
 
 
 @given(kwvalue=jsontype | jsontypes, instval=json)
@@ -60,17 +91,20 @@ def test_const(kwvalue, instval):
     assert result == isequal(instval, kwvalue)
 
 
+def decimalize(val):
+    if isinstance(val, float):
+        return Decimal(f'{val}')
+    return val
+
+
 @given(kwvalue=jsonnumber.filter(lambda x: x > 0), instval=jsonnumber)
 def test_multiple_of(kwvalue, instval):
-    def decimalize(val):
-        if isinstance(val, float):
-            return Decimal(f'{val}')
-        return val
-
     result = evaluate(MultipleOfKeyword, kwvalue, instval)
     try:
         assert result == (decimalize(instval) % decimalize(kwvalue) == 0)
     except InvalidOperation:
+        # the strategies generate only finite numbers, so this is raised
+        # solely when the quotient exceeds the decimal context precision
         pass
 
 
@@ -113,7 +147,7 @@ def test_min_length(kwvalue, instval):
 @given(kwvalue=hs.just(jsonpointer_regex), instval=hs.from_regex(jsonpointer_regex))
 def test_pattern(kwvalue, instval):
     result = evaluate(PatternKeyword, kwvalue, instval)
-    assert result == (re.search(kwvalue, instval) is not None)
+    assert result == (jsonpointer_pattern.search(instval) is not None)
 
 
 @given(kwvalue=hs.integers(min_value=0, max_value=20), instval=jsonflatarray)
@@ -132,11 +166,17 @@ def test_min_items(kwvalue, instval):
 def test_unique_items(kwvalue, instval):
     result = evaluate(UniqueItemsKeyword, kwvalue, instval)
     if kwvalue:
-        uniquified = []
-        for item in instval:
-            if not any(isequal(item, value) for value in uniquified):
-                uniquified += [item]
-        assert result == (len(instval) == len(uniquified))
+        try:
+            # fast path for arrays of primitives; booleans are tagged
+            # so that, as in isequal, they never match numbers
+            unique_count = len({(type(item) is bool, item) for item in instval})
+        except TypeError:
+            uniquified = []
+            for item in instval:
+                if not any(isequal(item, value) for value in uniquified):
+                    uniquified += [item]
+            unique_count = len(uniquified)
+        assert result == (len(instval) == unique_count)
     else:
         assert result is True
 
@@ -173,7 +213,7 @@ def test_min_properties(kwvalue, instval):
 @given(kwvalue=propnames, instval=jsonproperties)
 def test_required(kwvalue, instval):
     result = evaluate(RequiredKeyword, kwvalue, instval)
-    missing = any(name for name in kwvalue if name not in instval)
+    missing = not set(kwvalue).issubset(instval)
     assert result == (not missing)
 
 
@@ -183,7 +223,7 @@ def test_dependent_required(kwvalue, instval):
     missing = False
     for name, deps in kwvalue.items():
         if name in instval:
-            if any(dep for dep in deps if dep not in instval):
+            if not set(deps).issubset(instval):
                 missing = True
                 break
     assert result == (not missing)